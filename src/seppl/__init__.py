@@ -1,11 +1,75 @@
-from ._plugin import Plugin, PluginWithLogging, OutputProducer, InputConsumer, check_compatibility
-from ._plugin import LoggingHandler, Initializable, init_initializable
-from ._plugin import AliasSupporter, get_aliases, has_aliases, get_all_names
-from ._args import split_cmdline, split_args, args_to_objects, is_help_requested, enumerate_plugins, escape_args, unescape_args, resolve_handler
-from ._registry import Registry, MODE_DYNAMIC, MODE_EXPLICIT, MODES
-from ._class_registry import ClassListerRegistry, get_class_lister, DEFAULT
-from ._entry_points import generate_entry_points
-from ._help import generate_plugin_usage, generate_help, HELP_FORMATS, HELP_FORMAT_TEXT, HELP_FORMAT_MARKDOWN
-from ._types import get_class, get_class_name, classes_to_str, AnyData
-from ._metadata import MetaDataHandler, add_metadata, get_metadata
-from ._session import Session, SessionHandler
+_EXPORTS = {
+    "Plugin": "._plugin",
+    "PluginWithLogging": "._plugin",
+    "OutputProducer": "._plugin",
+    "InputConsumer": "._plugin",
+    "check_compatibility": "._plugin",
+    "LoggingHandler": "._plugin",
+    "Initializable": "._plugin",
+    "init_initializable": "._plugin",
+    "AliasSupporter": "._plugin",
+    "get_aliases": "._plugin",
+    "has_aliases": "._plugin",
+    "get_all_names": "._plugin",
+    "split_cmdline": "._args",
+    "split_args": "._args",
+    "split_args_v2": "._args",
+    "args_to_objects": "._args",
+    "is_help_requested": "._args",
+    "enumerate_plugins": "._args",
+    "escape_args": "._args",
+    "unescape_args": "._args",
+    "resolve_handler": "._args",
+    "Registry": "._registry",
+    "MODE_DYNAMIC": "._registry",
+    "MODE_EXPLICIT": "._registry",
+    "MODES": "._registry",
+    "ClassListerRegistry": "._class_registry",
+    "get_class_lister": "._class_registry",
+    "DEFAULT": "._class_registry",
+    "generate_entry_points": "._entry_points",
+    "generate_plugin_usage": "._help",
+    "generate_help": "._help",
+    "HELP_FORMATS": "._help",
+    "HELP_FORMAT_TEXT": "._help",
+    "HELP_FORMAT_MARKDOWN": "._help",
+    "get_class": "._types",
+    "get_class_name": "._types",
+    "classes_to_str": "._types",
+    "AnyData": "._types",
+    "MetaDataHandler": "._metadata",
+    "add_metadata": "._metadata",
+    "get_metadata": "._metadata",
+    "Session": "._session",
+    "SessionHandler": "._session",
+}
+""" maps the public attributes to the sub-modules defining them. """
+
+__all__ = sorted(_EXPORTS.keys())
+
+
+def __getattr__(name):
+    """
+    Resolves the public attributes lazily (PEP 562), so that importing seppl
+    does not import all sub-modules up front.
+
+    :param name: the name of the attribute to resolve
+    :type name: str
+    :return: the resolved attribute
+    """
+    if name in _EXPORTS:
+        from importlib import import_module
+        value = getattr(import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    """
+    Returns the available attributes.
+
+    :return: the list of attributes
+    :rtype: list
+    """
+    return sorted(set(globals().keys()) | set(__all__))
@@ -1,10 +1,68 @@
-import copy
-import shlex
+import functools
+import sys
 
-from typing import List, Dict, Tuple, Iterable, Set, Optional
+from typing import List, Dict, Tuple, Iterable, Set, Optional, Union
 from ._plugin import Plugin
 
 
+_WHITESPACE = frozenset(" \t\r\n")
+""" the characters that separate arguments. """
+
+_QUOTES = frozenset("'\"")
+""" the characters that quote arguments. """
+
+_BREAK = _WHITESPACE | _QUOTES
+""" the characters that end an unquoted word. """
+
+_HELP_FLAGS = frozenset({"-h", "--help", "--help-all", "--help-plugin"})
+""" the flags that request help output. """
+
+
+def _fast_split(cmdline: str) -> Optional[List[str]]:
+    """
+    Splits the command-line like shlex.split, but with a specialized tokenizer
+    that jumps between quotes/whitespace rather than stepping through a
+    character-at-a-time state machine. Backslashes require POSIX escape
+    semantics, in which case None is returned to signal falling back to shlex.
+
+    :param cmdline: the commandline to split
+    :type cmdline: str
+    :return: the list of arguments, None if shlex.split is required
+    :rtype: list or None
+    """
+    if "\\" in cmdline:
+        return None
+
+    result = []
+    i = 0
+    n = len(cmdline)
+    while i < n:
+        c = cmdline[i]
+        if c in _WHITESPACE:
+            i += 1
+            continue
+        # assemble the next argument from adjacent quoted/unquoted sections
+        parts = []
+        while i < n:
+            c = cmdline[i]
+            if c in _WHITESPACE:
+                break
+            if c in _QUOTES:
+                end = cmdline.find(c, i + 1)
+                if end < 0:
+                    raise ValueError("No closing quotation")
+                parts.append(cmdline[i + 1:end])
+                i = end + 1
+            else:
+                j = i + 1
+                while (j < n) and (cmdline[j] not in _BREAK):
+                    j += 1
+                parts.append(cmdline[i:j])
+                i = j
+        result.append("".join(parts))
+    return result
+
+
 def escape_args(args: List[str]) -> List[str]:
     """
     Escapes any unicode characters in the arguments.
@@ -14,10 +72,22 @@ def escape_args(args: List[str]) -> List[str]:
     :return: the (potentially) updated arguments
     :rtype: list
     """
-    result = []
+    if len(args) == 0:
+        return []
+    # fast path: escape all arguments with a single codec call by joining
+    # them with NUL; NUL itself escapes to "\x00", which is what we split
+    # on again -- only safe when the arguments contain neither NUL nor
+    # backslashes (those would produce ambiguous "\x00" sequences)
+    identity = True
     for arg in args:
-        result.append(arg.encode("unicode_escape").decode())
-    return result
+        if ("\0" in arg) or ("\\" in arg):
+            return [a if (a.isascii() and a.isprintable() and ("\\" not in a)) else a.encode("unicode_escape").decode() for a in args]
+        if identity and not (arg.isascii() and arg.isprintable()):
+            identity = False
+    # printable ASCII without backslashes passes through unchanged
+    if identity:
+        return list(args)
+    return "\0".join(args).encode("unicode_escape").decode().split("\\x00")
 
 
 def unescape_args(args: List[str]) -> List[str]:
@@ -29,10 +99,45 @@ def unescape_args(args: List[str]) -> List[str]:
     :return: the (potentially) updated arguments
     :rtype: list
     """
-    result = []
+    if len(args) == 0:
+        return []
+    # fast path: unescape all arguments with a single codec call by joining
+    # them with NUL, which unicode_escape passes through unchanged -- only
+    # safe when the arguments contain neither NUL nor escape sequences that
+    # could decode to NUL (i.e., no backslashes)
+    identity = True
     for arg in args:
-        result.append(arg.encode().decode("unicode_escape"))
-    return result
+        if ("\0" in arg) or ("\\" in arg):
+            return [a if (("\\" not in a) and a.isascii()) else a.encode().decode("unicode_escape") for a in args]
+        if identity and not arg.isascii():
+            identity = False
+    # ASCII without backslashes decodes to itself
+    if identity:
+        return list(args)
+    return "\0".join(args).encode().decode("unicode_escape").split("\0")
+
+
+@functools.lru_cache(maxsize=256)
+def _split_cmdline_cached(cmdline: str, unescape: bool) -> Tuple[str, ...]:
+    """
+    Splits the command-line into arguments, caching the result per command-line.
+    Returns a tuple, since cached values must be immutable.
+
+    :param cmdline: the commandline to split
+    :type cmdline: str
+    :param unescape: whether to unescape unicode chars
+    :type unescape: bool
+    :return: the tuple of arguments
+    :rtype: tuple
+    """
+    result = _fast_split(cmdline)
+    if result is None:
+        # deferred import: only needed for POSIX escape semantics
+        import shlex
+        result = shlex.split(cmdline)
+    if unescape:
+        result = unescape_args(result)
+    return tuple(result)
 
 
 def split_cmdline(cmdline: str, unescape: bool = False) -> List[str]:
@@ -46,10 +151,7 @@ def split_cmdline(cmdline: str, unescape: bool = False) -> List[str]:
     :return: the list of arguments
     :rtype: list
     """
-    result = shlex.split(cmdline)
-    if unescape:
-        result = unescape_args(result)
-    return result
+    return list(_split_cmdline_cached(cmdline, unescape))
 
 def resolve_handler(search: str, handlers: Set[str]) -> Optional[str]:
     """
@@ -76,6 +178,49 @@ def resolve_handler(search: str, handlers: Set[str]) -> Optional[str]:
     return None
 
 
+def _build_prefix_map(handlers: Set[str]) -> Dict[str, Optional[str]]:
+    """
+    Builds a lookup that maps every unique prefix of every handler to the
+    handler (or to None if the prefix is ambiguous). Exact handler names
+    always map to themselves, mirroring resolve_handler.
+
+    :param handlers: the set of valid handlers
+    :type handlers: set
+    :return: the prefix lookup
+    :rtype: dict
+    """
+    result = dict()
+    for handler in handlers:
+        for i in range(1, len(handler) + 1):
+            prefix = handler[:i]
+            if prefix in result:
+                result[prefix] = None
+            else:
+                result[prefix] = handler
+    # exact matches take precedence over ambiguous prefixes
+    for handler in handlers:
+        result[handler] = handler
+    # the empty string prefix-matches every handler, so it only resolves
+    # when there is exactly one (just like resolve_handler)
+    if "" not in result:
+        result[""] = next(iter(handlers)) if (len(handlers) == 1) else None
+    return result
+
+
+@functools.lru_cache(maxsize=32)
+def _prefix_map_cached(handlers: frozenset) -> Dict[str, Optional[str]]:
+    """
+    Returns the (cached) prefix lookup for the handler set; the same
+    handlers are typically used for every split within a session.
+
+    :param handlers: the set of valid handlers
+    :type handlers: frozenset
+    :return: the prefix lookup
+    :rtype: dict
+    """
+    return _build_prefix_map(handlers)
+
+
 def split_args(args: List[str], handlers: List[str], unescape: bool = False) -> Dict[str, List[str]]:
     """
     Splits the command-line arguments into handler and their associated arguments.
@@ -90,39 +235,97 @@ def split_args(args: List[str], handlers: List[str], unescape: bool = False) ->
     :return: the dictionary for handler index / handler name + options list
     :rtype: dict
     """
-    handlers_set = set(handlers)
+    global_args, chunks = split_args_v2(args, handlers, unescape=unescape)
+
     result = dict()
-    last_handler = ""
-    last_args = []
+    if global_args is not None:
+        result[""] = global_args
+        for i, chunk in enumerate(chunks, start=1):
+            result[str(i)] = chunk
+    elif len(chunks) > 0:
+        result["0"] = chunks[0]
+
+    return result
+
+
+def split_args_v2(args: List[str], handlers: List[str], unescape: bool = False) -> Tuple[Optional[List[str]], List[List[str]]]:
+    """
+    Splits the command-line arguments into global options and handler groups.
+    Unlike split_args, no stringified-index dictionary gets generated.
+
+    :param args: the command-line arguments to split
+    :type args: list
+    :param handlers: the list of valid handler names
+    :type handlers: list
+    :param unescape: whether to unescape unicode chars
+    :type unescape: bool
+    :return: tuple of the global options (None if no handler matched) and the
+             list of handler groups (each starting with the handler name);
+             when no handler matched, the sole group holds any remaining options
+    :rtype: tuple
+    """
+    if isinstance(handlers, (set, frozenset)):
+        handlers_set = handlers
+    else:
+        # interned names let dict/set probes succeed on identity
+        handlers_set = {sys.intern(h) for h in handlers}
 
     if unescape:
         args = unescape_args(args)
 
+    # classify every token with a single dict probe against the (cached)
+    # prefix lookup instead of a resolve_handler call per argument
+    prefix_map = _prefix_map_cached(frozenset(handlers_set))
+
+    global_args = None
+    chunks = []
+    last_args = []
+
     for arg in args:
-        handler = resolve_handler(arg, handlers_set)
+        handler = prefix_map.get(arg)
         if handler is not None:
-            if len(last_handler) > 0:
-                result[str(len(result))] = last_args
+            if global_args is None:
+                global_args = last_args
             else:
-                result[""] = last_args
-            last_handler = handler
+                chunks.append(last_args)
             last_args = [handler]
-            continue
         else:
             last_args.append(arg)
 
-    if len(last_args) > 0:
-        result[str(len(result))] = last_args
+    if (global_args is not None) or (len(last_args) > 0):
+        chunks.append(last_args)
 
-    return result
+    return global_args, chunks
 
 
-def args_to_objects(args: Dict[str, List[str]], valid_plugins: Dict[str, Plugin], allow_global_options: bool = False, allow_unknown_args: bool = False, unescape: bool = False) -> List[Plugin]:
+def _new_plugin(template: Plugin) -> Plugin:
     """
-    Instantiates the plugins from the parsed arguments dictionary.
+    Creates a fresh plugin instance from the template. Uses the no-args
+    constructor as a fast path and only falls back to the (slow) deepcopy
+    when the plugin requires it (_deepcopy_required class attribute) or
+    instantiation fails.
 
-    :param args: the arguments dictionary generated by split_args
-    :type args: dict
+    :param template: the plugin to use as template
+    :type template: Plugin
+    :return: the new instance
+    :rtype: Plugin
+    """
+    if not getattr(template, "_deepcopy_required", False):
+        try:
+            return template.__class__()
+        except Exception:
+            pass
+    # deferred import: only needed for plugins without a cheap clone path
+    import copy
+    return copy.deepcopy(template)
+
+
+def args_to_objects(args: Union[Dict[str, List[str]], Tuple[Optional[List[str]], List[List[str]]]], valid_plugins: Dict[str, Plugin], allow_global_options: bool = False, allow_unknown_args: bool = False, unescape: bool = False) -> List[Plugin]:
+    """
+    Instantiates the plugins from the parsed arguments.
+
+    :param args: the arguments dictionary generated by split_args or the tuple generated by split_args_v2
+    :type args: dict or tuple
     :param valid_plugins: the dictionary of valid plugins to use as templates
     :type valid_plugins: dict
     :param allow_global_options: whether global options are allowed (ie options that don't follow a plugin name)
@@ -134,17 +337,20 @@ def args_to_objects(args: Dict[str, List[str]], valid_plugins: Dict[str, Plugin]
     :return: the list of instantiated plugins
     :rtype: list
     """
-    result = []
-    for key in args:
-        if key == "":
-            if (not allow_global_options) and (len(args[""]) > 0):
-                raise Exception("No global options allowed (found: %s)!" % str(args[""]))
-            else:
-                continue
+    if isinstance(args, dict):
+        global_args = args.get("", None)
+        groups = [args[key] for key in args if key != ""]
+    else:
+        global_args, groups = args
+
+    if (global_args is not None) and (len(global_args) > 0) and not allow_global_options:
+        raise Exception("No global options allowed (found: %s)!" % str(global_args))
 
-        name = args[key][0]
-        plugin = copy.deepcopy(valid_plugins[name])
-        sub_args = args[key][1:]
+    result = []
+    for group in groups:
+        name = group[0]
+        plugin = _new_plugin(valid_plugins[name])
+        sub_args = group[1:]
         if unescape:
             sub_args = unescape_args(sub_args)
         unknown = plugin.parse_args(sub_args)
@@ -163,6 +369,11 @@ def is_help_requested(args: List[str]) -> Tuple[bool, bool, str]:
     :return: the tuple of help requested: (help_requested, plugin_details, plugin_name)
     :rtype: tuple
     """
+    # fast reject via a single C-level set intersection before scanning
+    # for the position of the specific flag
+    if _HELP_FLAGS.isdisjoint(args):
+        return False, False, None
+
     help_requested = False
     plugin_details = False
     plugin_name = None
@@ -196,15 +407,24 @@ def enumerate_plugins(plugins: Iterable[str], prefix: str = "", width: int = 72)
     :rtype: str
     """
     result = []
-    line = prefix
+    parts = [prefix]
+    line_len = len(prefix)
+    last_char = prefix[-1:]
     for plugin in sorted(plugins):
-        if (len(line) > 0) and (line[-1] != " "):
-            line += ", "
-        if len(line) + len(plugin) >= width:
-            result.append(line)
-            line = prefix + plugin
+        if (line_len > 0) and (last_char != " "):
+            parts.append(", ")
+            line_len += 2
+            last_char = " "
+        if line_len + len(plugin) >= width:
+            result.append("".join(parts))
+            parts = [prefix, plugin]
+            line_len = len(prefix) + len(plugin)
+            last_char = (prefix + plugin)[-1:]
         else:
-            line += plugin
-    if len(line) > 0:
-        result.append(line)
+            parts.append(plugin)
+            line_len += len(plugin)
+            if len(plugin) > 0:
+                last_char = plugin[-1:]
+    if line_len > 0:
+        result.append("".join(parts))
     return "\n".join(result)
@@ -1,11 +1,8 @@
+import functools
 import importlib
-import inspect
 import os
 import sys
-import traceback
-from typing import Callable, Union, List, Optional, Type, Dict
-
-from pkg_resources import working_set
+from typing import Callable, Union, List, Optional, Tuple, Type, Dict
 
 from ._types import get_class_name, get_class
 from ._plugin import Plugin, get_all_names
@@ -17,16 +14,48 @@ LIST_CLASSES = "list_classes"
 """ the default method for listing classes. """
 
 
+@functools.lru_cache(maxsize=None)
+def _entry_point_class_listers() -> List[str]:
+    """
+    Determines the class lister definitions advertised via the "class_lister"
+    entry point group. Cached, since entry points do not change at runtime.
+
+    :return: the list of class lister definitions
+    :rtype: list
+    """
+    from importlib.metadata import entry_points
+
+    result = []
+    eps = entry_points()
+    if hasattr(eps, "select"):
+        items = eps.select(group="class_lister")
+    else:
+        items = eps.get("class_lister", [])
+    for item in items:
+        # format: "name=module:function" or "name=module"
+        module, _, func = item.value.partition(":")
+        if len(func) > 0:
+            result.append(module + ":" + func)
+        else:
+            result.append(module)
+    return result
+
+
+@functools.lru_cache(maxsize=None)
 def get_class_lister(class_lister: str) -> Callable:
     """
     Parses the class_lister definition and returns the function.
     The default format is "module_name:function_name".
     If ":function_name" is omitted it is assumed to be ":list_classes".
+    Results are cached, as the definition always resolves to the same function.
 
     :param class_lister: the class lister definition to parse
     :type class_lister: str
     :return: the parsed function
     """
+    # deferred import: keeps "import seppl" cheap
+    import inspect
+
     if ":" not in class_lister:
         module_name = class_lister
         func_name = LIST_CLASSES
@@ -53,6 +82,10 @@ class ClassListerRegistry:
     Registry for managing class hierarchies via class listers.
     """
 
+    _shared_classes = dict()
+    """ process-wide cache of determined classes, shared across registry instances,
+    keyed by superclass and effective class lister configuration. """
+
     def __init__(self, default_class_listers: Union[str, List[str]] = None, env_class_listers: str = None,
                  excluded_class_listers: Union[str, List[str]] = None, env_excluded_class_listers: str = None):
         """
@@ -68,9 +101,13 @@ class ClassListerRegistry:
         """
 
         self._classes = dict()
+        self._subclass_cache = dict()
+        self._plugin_cache = dict()
         self._default_class_listers = None
+        self._default_joined = ""
         self._env_class_listers = None
         self._excluded_class_listers = None
+        self._excluded_set = frozenset()
         self._env_excluded_class_listers = None
         self._custom_class_listers = None
 
@@ -80,12 +117,12 @@ class ClassListerRegistry:
         self.env_excluded_class_listers = env_excluded_class_listers
 
     @property
-    def default_class_listers(self) -> Optional[List[str]]:
+    def default_class_listers(self) -> Optional[Tuple[str, ...]]:
         """
         Returns the class lister functions.
 
         :return: the functions
-        :rtype: list
+        :rtype: tuple
         """
         return self._default_class_listers
 
@@ -100,13 +137,16 @@ class ClassListerRegistry:
         if class_listers is None:
             class_listers = ""
         if isinstance(class_listers, str):
-            class_listers = [x.strip() for x in class_listers.split(",")]
+            class_listers = tuple(x.strip() for x in class_listers.split(","))
         elif isinstance(class_listers, list):
-            class_listers = class_listers[:]
+            class_listers = tuple(class_listers)
         else:
             raise Exception("default_class_listers must be either str or list, but got: %s" % str(type(class_listers)))
         self._default_class_listers = class_listers
+        self._default_joined = ",".join(class_listers)
         self._classes = dict()
+        self._subclass_cache = dict()
+        self._plugin_cache = dict()
 
     @property
     def env_class_listers(self) -> Optional[str]:
@@ -128,14 +168,16 @@ class ClassListerRegistry:
         """
         self._env_class_listers = class_listers
         self._classes = dict()
+        self._subclass_cache = dict()
+        self._plugin_cache = dict()
 
     @property
-    def excluded_class_listers(self) -> Optional[List[str]]:
+    def excluded_class_listers(self) -> Optional[Tuple[str, ...]]:
         """
         Returns the excluded class lister functions.
 
         :return: the functions
-        :rtype: list
+        :rtype: tuple
         """
         return self._excluded_class_listers
 
@@ -150,13 +192,16 @@ class ClassListerRegistry:
         if excluded_class_listers is None:
             excluded_class_listers = ""
         if isinstance(excluded_class_listers, str):
-            excluded_class_listers = [x.strip() for x in excluded_class_listers.split(",")]
+            excluded_class_listers = tuple(x.strip() for x in excluded_class_listers.split(","))
         elif isinstance(excluded_class_listers, list):
-            excluded_class_listers = excluded_class_listers[:]
+            excluded_class_listers = tuple(excluded_class_listers)
         else:
             raise Exception("excluded_class_listers must be either str or list, but got: %s" % str(type(excluded_class_listers)))
         self._excluded_class_listers = excluded_class_listers
+        self._excluded_set = frozenset(excluded_class_listers)
         self._classes = dict()
+        self._subclass_cache = dict()
+        self._plugin_cache = dict()
 
     @property
     def env_excluded_class_listers(self) -> Optional[str]:
@@ -178,6 +223,8 @@ class ClassListerRegistry:
         """
         self._env_excluded_class_listers = excluded_class_listers
         self._classes = dict()
+        self._subclass_cache = dict()
+        self._plugin_cache = dict()
 
     @property
     def custom_class_listers(self) -> Optional[List[str]]:
@@ -199,6 +246,8 @@ class ClassListerRegistry:
         """
         self._custom_class_listers = class_listers
         self._classes = dict()
+        self._subclass_cache = dict()
+        self._plugin_cache = dict()
 
     def has_env_class_listers(self) -> bool:
         """
@@ -207,10 +256,10 @@ class ClassListerRegistry:
         :return: True if set
         :rtype: bool
         """
-        return (self._env_class_listers is not None) \
-               and (len(self._env_class_listers) > 0) \
-               and (os.getenv(self._env_class_listers) is not None) \
-               and (len(os.getenv(self._env_class_listers)) > 0)
+        if (self._env_class_listers is None) or (len(self._env_class_listers) == 0):
+            return False
+        value = os.getenv(self._env_class_listers)
+        return (value is not None) and (len(value) > 0)
 
     def has_env_excluded_class_listers(self) -> bool:
         """
@@ -219,10 +268,10 @@ class ClassListerRegistry:
         :return: True if set
         :rtype: bool
         """
-        return (self._env_excluded_class_listers is not None) \
-               and (len(self._env_excluded_class_listers) > 0) \
-               and (os.getenv(self._env_excluded_class_listers) is not None) \
-               and (len(os.getenv(self._env_excluded_class_listers)) > 0)
+        if (self._env_excluded_class_listers is None) or (len(self._env_excluded_class_listers) == 0):
+            return False
+        value = os.getenv(self._env_excluded_class_listers)
+        return (value is not None) and (len(value) > 0)
 
     def _expand_default_class_listers_placeholder(self, c: str) -> str:
         """
@@ -233,20 +282,15 @@ class ClassListerRegistry:
         :return: the expanded class listers string
         :rtype: str
         """
-        if DEFAULT in c:
-            if len(self.default_class_listers) > 0:
-                c = c.replace(DEFAULT, ",".join(self.default_class_listers))
-            else:
-                c = c.replace(DEFAULT, "")
-        return c
+        return c.replace(DEFAULT, self._default_joined)
 
-    def actual_fallback_class_listers(self) -> List[str]:
+    def actual_fallback_class_listers(self) -> Union[List[str], Tuple[str, ...]]:
         """
         Returns list the of class listers to fall back on.
         Precedence: custom_class_listers > env_class_listers > default_class_listers
 
-        :return: the list of class listers
-        :rtype: list
+        :return: the class listers
+        :rtype: list or tuple
         """
         if (self._custom_class_listers is not None) and (len(self._custom_class_listers) > 0):
             return self._custom_class_listers
@@ -255,21 +299,21 @@ class ClassListerRegistry:
             m = self._expand_default_class_listers_placeholder(os.getenv(self.env_class_listers))
             return [x.strip() for x in m.split(",")]
 
-        return self.default_class_listers[:]
+        return self._default_class_listers
 
-    def actual_excluded_class_listers(self) -> List[str]:
+    def actual_excluded_class_listers(self) -> Union[List[str], Tuple[str, ...]]:
         """
         Returns list the of excluded class listers.
         Precedence: excluded_env_class_listers > excluded_class_listers
 
-        :return: the list of class listers
-        :rtype: list
+        :return: the class listers
+        :rtype: list or tuple
         """
         if self.has_env_excluded_class_listers():
             m = self._expand_default_class_listers_placeholder(os.getenv(self._env_excluded_class_listers))
             return [x.strip() for x in m.split(",")]
 
-        return self.excluded_class_listers[:]
+        return self._excluded_class_listers
 
     def _determine_sub_classes(self, cls: Type, module_name: str) -> List[str]:
         """
@@ -281,6 +325,14 @@ class ClassListerRegistry:
         :return: the list of sub-classes
         :rtype: list
         """
+        key = (get_class_name(cls), module_name)
+        if key in self._subclass_cache:
+            return self._subclass_cache[key]
+
+        # deferred imports: keep "import seppl" cheap
+        import inspect
+        import traceback
+
         result = []
 
         try:
@@ -290,23 +342,15 @@ class ClassListerRegistry:
             traceback.print_exc()
             return result
 
-        for att_name in dir(module):
-            if att_name.startswith("_"):
-                continue
-            if att_name.startswith("Abstract"):
+        # no trial instantiation here: plugins() already handles classes
+        # whose constructor raises when it instantiates them
+        for att_name, att in vars(module).items():
+            if att_name.startswith(("_", "Abstract")):
                 continue
-            att = getattr(module, att_name)
             if inspect.isclass(att) and not inspect.isabstract(att) and issubclass(att, cls):
-                try:
-                    obj = att()
-                except NotImplementedError:
-                    pass
-                except:
-                    print("Problem encountered instantiating: %s" % (module_name + "." + att_name), file=sys.stderr)
-                    traceback.print_exc()
-                    continue
                 result.append(get_class_name(att))
 
+        self._subclass_cache[key] = result
         return result
 
     def _determine_from_class_listers(self, c: str, class_listers: List[str]) -> List[str]:
@@ -320,10 +364,15 @@ class ClassListerRegistry:
         :return: the determined list of subclasses
         :rtype: list
         """
+        # deferred imports: keep "import seppl" cheap
+        import inspect
+        import traceback
+
         result = []
 
         if len(class_listers) > 0:
             cls = None
+            sub_modules = []
 
             for class_lister in class_listers:
                 if class_lister == "":
@@ -344,16 +393,25 @@ class ClassListerRegistry:
                     traceback.print_exc()
                     continue
 
-                if self.excluded_class_listers is not None:
-                    if class_lister in self.excluded_class_listers:
-                        continue
+                if class_lister in self._excluded_set:
+                    continue
 
                 if inspect.isfunction(func):
                     class_dict = func()
                     if c in class_dict:
-                        for sub_module in class_dict[c]:
-                            sub_classes = self._determine_sub_classes(cls, sub_module)
-                            result.extend(sub_classes)
+                        sub_modules.extend(class_dict[c])
+
+            # module imports are I/O bound, so scanning the sub-modules in
+            # parallel speeds up discovery; small workloads stay sequential
+            # to avoid the pool setup cost
+            if len(sub_modules) > 2:
+                from concurrent.futures import ThreadPoolExecutor
+                with ThreadPoolExecutor(max_workers=min(8, len(sub_modules))) as executor:
+                    for sub_classes in executor.map(lambda m: self._determine_sub_classes(cls, m), sub_modules):
+                        result.extend(sub_classes)
+            else:
+                for sub_module in sub_modules:
+                    result.extend(self._determine_sub_classes(cls, sub_module))
 
         return result
 
@@ -367,14 +425,7 @@ class ClassListerRegistry:
         :rtype: list
         """
         result = []
-        class_listers = []
-        for item in working_set.iter_entry_points("class_lister", None):
-            if len(item.attrs) > 0:
-                # format: "name=module:function"
-                class_listers.append(item.module_name + ":" + item.attrs[0])
-            else:
-                # format: "name=module"
-                class_listers.append(item.module_name)
+        class_listers = _entry_point_class_listers()
         if len(class_listers) > 0:
             result = self._determine_from_class_listers(c, class_listers)
         return result
@@ -390,10 +441,11 @@ class ClassListerRegistry:
         """
         result = []
 
-        if os.getenv(self.env_class_listers) is not None:
+        env = os.getenv(self.env_class_listers)
+        if env is not None:
             # format: "classlister1,classlister2,..."
             # classlister format: "module_name:function_name" or "module_name" if "list_classes" as method
-            class_listers = os.getenv(self.env_class_listers).split(",")
+            class_listers = env.split(",")
             result = self._determine_from_class_listers(c, class_listers)
 
         return result
@@ -407,6 +459,17 @@ class ClassListerRegistry:
         :return: the list of classes for the superclass
         :rtype: list
         """
+        # another instance with the same effective configuration may have
+        # determined the classes already
+        key = (c,
+               tuple(self.actual_fallback_class_listers()),
+               tuple(self.actual_excluded_class_listers()),
+               (self._custom_class_listers is not None) and (len(self._custom_class_listers) > 0),
+               self.has_env_class_listers())
+        if key in ClassListerRegistry._shared_classes:
+            self._classes[c] = ClassListerRegistry._shared_classes[key]
+            return
+
         all_classes = set()
 
         # from entry points
@@ -427,6 +490,7 @@ class ClassListerRegistry:
                 all_classes.remove(cls)
 
         self._classes[c] = sorted(list(all_classes))
+        ClassListerRegistry._shared_classes[key] = self._classes[c]
 
     def plugins(self, c: Union[str, Type], fail_if_empty: bool = True) -> Dict[str, Plugin]:
         """
@@ -440,6 +504,11 @@ class ClassListerRegistry:
         """
         if not isinstance(c, str):
             c = get_class_name(c)
+        if c in self._plugin_cache:
+            result = self._plugin_cache[c]
+            if fail_if_empty and (len(result) == 0):
+                raise Exception("No classes found for: %s" % c)
+            return result
         if c not in self._classes:
             self._initialize(c)
         result = dict()
@@ -450,12 +519,14 @@ class ClassListerRegistry:
                     plugin = cls()
                     names = get_all_names(plugin)
                     for name in names:
-                        result[name] = plugin
+                        result[sys.intern(name)] = plugin
                 except NotImplementedError:
                     pass
                 except:
+                    import traceback
                     print("Failed to instantiate: %s" % cname)
                     traceback.print_exc()
+        self._plugin_cache[c] = result
         if fail_if_empty and (len(result) == 0):
             raise Exception("No classes found for: %s" % c)
         return result
@@ -1,9 +1,13 @@
 import importlib
 import json
+import sys
 
 from typing import List, Dict
 from ._plugin import Plugin
 
+_PARENT_OK = dict()
+""" caches whether a parent module could be imported (module name -> bool). """
+
 
 def _to_entry_point(plugin: Plugin) -> str:
     """
@@ -21,9 +25,18 @@ def _to_entry_point(plugin: Plugin) -> str:
     if parts[-1].startswith("_"):
         parts.pop()
         m = ".".join(parts)
-        try:
-            importlib.import_module(m)
-        except:
+        ok = _PARENT_OK.get(m)
+        if ok is None:
+            if m in sys.modules:
+                ok = True
+            else:
+                try:
+                    importlib.import_module(m)
+                    ok = True
+                except:
+                    ok = False
+            _PARENT_OK[m] = ok
+        if not ok:
             # can't remove the last and private module, so we'll stick with the full path
             m = plugin.__module__
 
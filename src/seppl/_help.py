@@ -1,4 +1,5 @@
 import os
+import sys
 from typing import List
 
 from ._plugin import Plugin, get_aliases
@@ -26,30 +27,25 @@ def generate_plugin_usage(plugin: Plugin, help_format: str = HELP_FORMAT_TEXT, h
         raise Exception("Unhandled help format: %s" % help_format)
 
     aliases = get_aliases(plugin)
-    result = ""
+    name = plugin.name()
+    parts = []
     if help_format == HELP_FORMAT_TEXT:
-        result += "\n" + plugin.name() + "\n" + "=" * len(plugin.name()) + "\n"
-        result = result.strip()
-        result += "\n\n"
+        parts.append(name + "\n" + "=" * len(name) + "\n\n")
         if len(aliases) > 0:
-            result += "Alias(es): %s\n\n" % ", ".join(aliases)
-        result += plugin.format_help() + "\n"
+            parts.append("Alias(es): %s\n\n" % ", ".join(aliases))
+        parts.append(plugin.format_help() + "\n")
     elif help_format == HELP_FORMAT_MARKDOWN:
-        result += "#"*heading_level + " " + plugin.name() + "\n"
-        result += "\n"
-        result = result.strip()
-        result += "\n\n"
+        parts.append("#" * heading_level + " " + name + "\n\n")
         if len(aliases) > 0:
-            result += "Alias(es): %s\n\n" % ", ".join(aliases)
-        result += plugin.description() + "\n"
-        result += "\n"
-        result += "```\n"
-        result += plugin.format_help()
-        result += "```\n"
+            parts.append("Alias(es): %s\n\n" % ", ".join(aliases))
+        parts.append(plugin.description() + "\n\n")
+        parts.append("```\n")
+        parts.append(plugin.format_help())
+        parts.append("```\n")
     else:
         raise Exception("Unhandled help format: %s" % help_format)
 
-    return result
+    return "".join(parts)
 
 
 def generate_help(plugins: List[Plugin], help_format: str = HELP_FORMAT_TEXT, heading_level: int = 1,
@@ -69,22 +65,29 @@ def generate_help(plugins: List[Plugin], help_format: str = HELP_FORMAT_TEXT, he
     if help_format not in HELP_FORMATS:
         raise Exception("Unknown help format: %s" % help_format)
 
+    if help_format == HELP_FORMAT_TEXT:
+        suffix = ".txt"
+    elif help_format == HELP_FORMAT_MARKDOWN:
+        suffix = ".md"
+    else:
+        raise Exception("Unhandled help format: %s" % help_format)
+
+    is_dir = (output_path is not None) and os.path.isdir(output_path)
+
     for p in plugins:
         help_screen = generate_plugin_usage(p, help_format=help_format, heading_level=heading_level)
-    
+
         if output_path is None:
-            print(help_screen)
+            # write/flush once per plugin rather than per line
+            sys.stdout.write(help_screen)
+            sys.stdout.write("\n")
         else:
-            if help_format == HELP_FORMAT_TEXT:
-                suffix = ".txt"
-            elif help_format == HELP_FORMAT_MARKDOWN:
-                suffix = ".md"
-            else:
-                raise Exception("Unhandled help format: %s" % help_format)
-    
-            if os.path.isdir(output_path):
+            if is_dir:
                 output_file = os.path.join(output_path, p.name() + suffix)
             else:
                 output_file = output_path
-            with open(output_file, "w") as fp:
+            with open(output_file, "w", buffering=1 << 16) as fp:
                 fp.write(help_screen)
+
+    if output_path is None:
+        sys.stdout.flush()
@@ -1,9 +1,10 @@
 import argparse
+import copy
 import logging
 import sys
 import traceback
 
-from typing import List
+from typing import List, Tuple
 from ._types import classes_to_str, get_class_name, AnyData
 
 from wai.logging import LOGGING_WARNING, set_logging_level, add_logging_level, add_logger_name
@@ -17,6 +18,41 @@ class Plugin:
     Base class for plugins.
     """
 
+    _deepcopy_required = False
+    """ whether fresh instances must be created via copy.deepcopy of the template
+    rather than the (faster) no-args constructor, e.g., when the constructor
+    does not restore all state. """
+
+    _DEEP_ATTRS = ()
+    """ the attributes that require a recursive copy in __deepcopy__, all other
+    attributes get copied shallowly. """
+
+    def __init__(self):
+        """
+        Initializes the plugin.
+        """
+        self._argparser = None
+
+    def __deepcopy__(self, memo):
+        """
+        Creates a copy of the plugin without the generic deepcopy machinery:
+        a new bare instance gets its attributes copied over shallowly, with
+        only the attributes listed in _DEEP_ATTRS copied recursively.
+
+        :param memo: the memo dictionary of objects already copied
+        :type memo: dict
+        :return: the copy of the plugin
+        :rtype: Plugin
+        """
+        cls = self.__class__
+        result = cls.__new__(cls)
+        memo[id(self)] = result
+        result.__dict__.update(self.__dict__)
+        for att in self._DEEP_ATTRS:
+            if att in self.__dict__:
+                result.__dict__[att] = copy.deepcopy(self.__dict__[att], memo)
+        return result
+
     def name(self) -> str:
         """
         Returns the name of the handler, used as sub-command.
@@ -49,6 +85,25 @@ class Plugin:
         parser.add_argument(UNKNOWN_ARGS, nargs=argparse.REMAINDER, help=argparse.SUPPRESS)
         return parser
 
+    def _get_argparser(self) -> argparse.ArgumentParser:
+        """
+        Returns the argument parser, constructing and caching it on first use.
+
+        :return: the parser
+        :rtype: argparse.ArgumentParser
+        """
+        parser = getattr(self, "_argparser", None)
+        if parser is None:
+            parser = self._create_argparser()
+            self._argparser = parser
+        return parser
+
+    def _invalidate_argparser(self):
+        """
+        Invalidates the cached argument parser, e.g., after options changed dynamically.
+        """
+        self._argparser = None
+
     def _apply_args(self, ns: argparse.Namespace):
         """
         Initializes the object with the arguments of the parsed namespace.
@@ -67,7 +122,7 @@ class Plugin:
         :return: any unknown args
         :rtype: list
         """
-        parser = self._create_argparser()
+        parser = self._get_argparser()
         ns = parser.parse_args(args)
         self._apply_args(ns)
         return ns.unknown_args
@@ -76,7 +131,7 @@ class Plugin:
         """
         Outputs the help in the console.
         """
-        self._create_argparser().print_help()
+        self._get_argparser().print_help()
 
     def format_help(self) -> str:
         """
@@ -85,7 +140,7 @@ class Plugin:
         :return: the help string
         :rtype: str
         """
-        return self._create_argparser().format_help()
+        return self._get_argparser().format_help()
 
 
 class AliasSupporter(object):
@@ -121,25 +176,32 @@ def get_aliases(o) -> List[str]:
     :return: the list of aliases
     :rtype: list
     """
-    result = []
-    if isinstance(o, AliasSupporter):
-        aliases = o.aliases()
-        if aliases is not None:
-            result.extend(aliases)
-    return result
+    # duck-typed rather than isinstance(o, AliasSupporter): cheaper and lets
+    # plugins supply aliases without inheriting from the mixin
+    fn = getattr(o, "aliases", None)
+    if fn is None:
+        return []
+    aliases = fn()
+    if not aliases:
+        return []
+    return list(aliases)
 
 
-def get_all_names(o: Plugin) -> List[str]:
+def get_all_names(o: Plugin) -> Tuple[str, ...]:
     """
     Returns all the names for the plugin, including any aliases.
+    The names get cached on the instance, as registries and help generation
+    ask for them repeatedly.
 
     :param o: the plugin to get the names for
     :type o: Plugin
-    :return: the list of aliases
-    :rtype: list
+    :return: the names
+    :rtype: tuple
     """
-    result = [o.name()]
-    result.extend(get_aliases(o))
+    result = getattr(o, "_cached_all_names", None)
+    if result is None:
+        result = (o.name(),) + tuple(get_aliases(o))
+        o._cached_all_names = result
     return result
 
 
@@ -313,30 +375,31 @@ def check_compatibility(plugins: List[Plugin], match_all=AnyData):
     for i in range(len(plugins) - 1):
         plugin1 = plugins[i]
         plugin2 = plugins[i + 1]
-        index1 = "#" + str(i)
-        index2 = "#" + str(i+1)
         if not isinstance(plugin1, OutputProducer):
-            raise Exception(index1 + "/" + plugin1.name() + " is not an OutputProducer!")
+            raise Exception("#%d/%s is not an OutputProducer!" % (i, plugin1.name()))
         if not isinstance(plugin2, InputConsumer):
-            raise Exception(index2 + "/" + plugin2.name() + " is not an InputConsumer!")
+            raise Exception("#%d/%s is not an InputConsumer!" % (i + 1, plugin2.name()))
         classes1 = plugin1.generates()
         classes2 = plugin2.accepts()
         #
         if (match_all in classes1) or (match_all in classes2):
             return
-        compatible = False
-        for class1 in classes1:
-            if class1 in classes2:
-                compatible = True
-                break
-            for class2 in classes2:
-                if issubclass(class1, class2):
+        # direct matches via set lookup, subclass cross-product only as fallback
+        accepted = set(classes2)
+        compatible = not accepted.isdisjoint(classes1)
+        if not compatible:
+            for class1 in classes1:
+                if not accepted.isdisjoint(class1.__mro__):
                     compatible = True
                     break
-            if compatible:
-                break
+                for class2 in classes2:
+                    if issubclass(class1, class2):
+                        compatible = True
+                        break
+                if compatible:
+                    break
         if not compatible:
             raise Exception(
-                "Output(s) of " + index1 + "/" + plugin1.name()
-                + " not compatible with input(s) of " + index2 + "/" + plugin2.name() + ": "
-                + classes_to_str(classes1) + " != " + classes_to_str(classes2))
+                "Output(s) of #%d/%s not compatible with input(s) of #%d/%s: %s != %s"
+                % (i, plugin1.name(), i + 1, plugin2.name(),
+                   classes_to_str(classes1), classes_to_str(classes2)))
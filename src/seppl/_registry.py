@@ -1,11 +1,9 @@
 import importlib
-import inspect
+import logging
 import os
 import sys
-import traceback
 
 from typing import List, Union, Optional, Dict
-from pkg_resources import working_set
 
 from ._plugin import get_all_names, Plugin
 from ._types import get_class, get_class_name
@@ -18,9 +16,55 @@ MODES = [
     MODE_DYNAMIC,
 ]
 
+_MODES_SET = frozenset(MODES)
+""" for fast membership tests, MODES stays a list for listing/ordering. """
+
 DEFAULT = "DEFAULT"
 """ the placeholder for the default modules in the environment variable. """
 
+_logger = logging.getLogger(__name__)
+""" the logger for reporting problems during plugin discovery. """
+
+_module_class_cache = dict()
+""" caches the plugin classes discovered per module: (module name, superclass name) -> tuple of classes. """
+
+
+def _parse_module_list(s: str) -> List[str]:
+    """
+    Parses a comma-separated string of module names into a list.
+
+    :param s: the string to parse
+    :type s: str
+    :return: the list of module names
+    :rtype: list
+    """
+    return [x.strip() for x in s.split(",")]
+
+
+_entry_points_cache = None
+""" caches the full entry points collection, since importlib.metadata re-scans the distributions on every call. """
+
+
+def _iter_entry_points(group: str):
+    """
+    Iterates over the entry points of the specified group, using the fast
+    importlib.metadata rather than the deprecated pkg_resources.
+
+    :param group: the entry point group to iterate
+    :type group: str
+    :return: the iterator over the entry points
+    """
+    global _entry_points_cache
+
+    eps = _entry_points_cache
+    if eps is None:
+        from importlib.metadata import entry_points
+        eps = _entry_points_cache = entry_points()
+    if hasattr(eps, "select"):
+        return eps.select(group=group)
+    else:
+        return eps.get(group, [])
+
 
 class Registry:
     """
@@ -73,6 +117,22 @@ class Registry:
     (and you don't want all the base plugins to be output as well).
     """
 
+    _shared_plugins = dict()
+    """ caches the resolved plugin classes per registry configuration, shared across instances:
+    (mode, group, superclass, modules, excluded, uniqueness) -> dict of name -> class. """
+
+    @classmethod
+    def clear_discovery_cache(cls):
+        """
+        Clears the process-wide discovery caches (shared plugin classes, scanned
+        module classes, entry points), e.g., for tests or when plugins get
+        installed/registered after the first discovery.
+        """
+        global _entry_points_cache
+        cls._shared_plugins.clear()
+        _module_class_cache.clear()
+        _entry_points_cache = None
+
     def __init__(self, mode: Optional[str] = MODE_EXPLICIT,
                  default_modules: Optional[Union[str, List[str]]] = None,
                  env_modules: Optional[str] = None,
@@ -96,16 +156,20 @@ class Registry:
         :param enforce_uniqueness: whether plugin names must be unique
         :type enforce_uniqueness: bool
         """
-        if mode not in MODES:
+        if mode not in _MODES_SET:
             raise Exception("Unknown mode: %s" % mode)
 
         self._plugins = dict()
         self._all_plugins = dict()
+        self._class_instances = dict()
         self._custom_modules = None
         self._default_modules = None
+        self._default_modules_joined = ""
         self._env_modules = None
         self._excluded_modules = None
         self._excluded_env_modules = None
+        self._excluded_prefixes = None
+        self._env_parse_cache = dict()
 
         self.mode = mode
         self.default_modules = default_modules
@@ -121,10 +185,10 @@ class Registry:
         :return: True if set
         :rtype: bool
         """
-        return (self._env_modules is not None) \
-               and (len(self._env_modules) > 0) \
-               and (os.getenv(self._env_modules) is not None) \
-               and (len(os.getenv(self._env_modules)) > 0)
+        if (self._env_modules is None) or (len(self._env_modules) == 0):
+            return False
+        value = os.getenv(self._env_modules)
+        return (value is not None) and (len(value) > 0)
 
     def has_excluded_env_modules(self) -> bool:
         """
@@ -133,10 +197,10 @@ class Registry:
         :return: True if set
         :rtype: bool
         """
-        return (self._excluded_env_modules is not None) \
-               and (len(self._excluded_env_modules) > 0) \
-               and (os.getenv(self._excluded_env_modules) is not None) \
-               and (len(os.getenv(self._excluded_env_modules)) > 0)
+        if (self._excluded_env_modules is None) or (len(self._excluded_env_modules) == 0):
+            return False
+        value = os.getenv(self._excluded_env_modules)
+        return (value is not None) and (len(value) > 0)
 
     @property
     def default_modules(self) -> Optional[List[str]]:
@@ -156,17 +220,22 @@ class Registry:
         :param modules: the list of modules to use, None to unset
         :type modules: list
         """
-        if modules is None:
-            modules = ""
-        if isinstance(modules, str):
-            modules = [x.strip() for x in modules.split(",")]
-        elif isinstance(modules, list):
+        if isinstance(modules, list):
             modules = modules[:]
+        elif modules is None:
+            modules = [""]
+        elif isinstance(modules, str):
+            modules = _parse_module_list(modules)
         else:
-            raise Exception("default_modules must be either str or list, but got: %s" % str(type(modules)))
+            raise TypeError("default_modules must be either str or list, but got: %s" % type(modules).__name__)
         if len(modules) == 0:
             raise Exception("No default modules defined!")
         self._default_modules = modules
+        self._default_modules_joined = ",".join(modules)
+        self._env_parse_cache = dict()
+        # the DEFAULT placeholder in the excluded-modules env var expands to
+        # the default modules, so the prefixes must be recomputed as well
+        self._excluded_prefixes = None
         self._plugins = dict()
 
     @property
@@ -187,15 +256,16 @@ class Registry:
         :param modules: the list of modules to exclude, None to unset
         :type modules: list
         """
-        if modules is None:
-            modules = ""
-        if isinstance(modules, str):
-            modules = [x.strip() for x in modules.split(",")]
-        elif isinstance(modules, list):
+        if isinstance(modules, list):
             modules = modules[:]
+        elif modules is None:
+            modules = [""]
+        elif isinstance(modules, str):
+            modules = _parse_module_list(modules)
         else:
-            raise Exception("excluded_modules must be either str or list, but got: %s" % str(type(modules)))
+            raise TypeError("excluded_modules must be either str or list, but got: %s" % type(modules).__name__)
         self._excluded_modules = modules
+        self._excluded_prefixes = None
         self._plugins = dict()
 
     @property
@@ -249,12 +319,7 @@ class Registry:
         :return: the expanded modules string
         :rtype: str
         """
-        if DEFAULT in m:
-            if len(self.default_modules) > 0:
-                m = m.replace(DEFAULT, ",".join(self.default_modules))
-            else:
-                m = m.replace(DEFAULT, "")
-        return m
+        return m.replace(DEFAULT, self._default_modules_joined)
 
     def actual_fallback_modules(self) -> List[str]:
         """
@@ -267,9 +332,14 @@ class Registry:
         if (self._custom_modules is not None) and (len(self._custom_modules) > 0):
             return self._custom_modules
 
-        if self.has_env_modules():
-            m = self._expand_default_modules_placeholder(os.getenv(self.env_modules))
-            return [x.strip() for x in m.split(",")]
+        if (self._env_modules is not None) and (len(self._env_modules) > 0):
+            value = os.getenv(self._env_modules)
+            if (value is not None) and (len(value) > 0):
+                parsed = self._env_parse_cache.get(value)
+                if parsed is None:
+                    parsed = _parse_module_list(self._expand_default_modules_placeholder(value))
+                    self._env_parse_cache[value] = parsed
+                return parsed[:]
 
         return self.default_modules[:]
 
@@ -281,9 +351,14 @@ class Registry:
         :return: the list of modules
         :rtype: list
         """
-        if self.has_excluded_env_modules():
-            m = self._expand_default_modules_placeholder(os.getenv(self._excluded_env_modules))
-            return [x.strip() for x in m.split(",")]
+        if (self._excluded_env_modules is not None) and (len(self._excluded_env_modules) > 0):
+            value = os.getenv(self._excluded_env_modules)
+            if (value is not None) and (len(value) > 0):
+                parsed = self._env_parse_cache.get(value)
+                if parsed is None:
+                    parsed = _parse_module_list(self._expand_default_modules_placeholder(value))
+                    self._env_parse_cache[value] = parsed
+                return parsed[:]
 
         return self.excluded_modules[:]
 
@@ -294,17 +369,21 @@ class Registry:
         :param o: the plugin classname/object to check
         :return: True if excluded, otherwise False
         """
-        result = False
-        excl = self.actual_excluded_modules()
+        if self.has_excluded_env_modules():
+            # the env var's value can change between calls, so never cache
+            prefixes = tuple(m + "." for m in self.actual_excluded_modules() if len(m) > 0)
+        else:
+            prefixes = self._excluded_prefixes
+            if prefixes is None:
+                prefixes = tuple(m + "." for m in self.actual_excluded_modules() if len(m) > 0)
+                self._excluded_prefixes = prefixes
+        if len(prefixes) == 0:
+            return False
         if isinstance(o, str):
             classname = o
         else:
             classname = get_class_name(o)
-        for m in excl:
-            if classname.startswith(m + "."):
-                result = True
-                break
-        return result
+        return classname.startswith(prefixes)
 
     def _register_plugin(self, d: Dict[str, Plugin], o: Plugin) -> bool:
         """
@@ -321,18 +400,39 @@ class Registry:
         if self.is_excluded(o):
             return False
         names = get_all_names(o)
-        present = any([x in self._all_plugins for x in names])
-        if self.enforce_uniqueness and present:
+        all_plugins = self._all_plugins
+        if self.enforce_uniqueness and not all_plugins.keys().isdisjoint(names):
+            cls_name = get_class_name(o)
             for name in names:
-                if get_class_name(self._all_plugins[name]) != get_class_name(o):
+                existing = all_plugins.get(name)
+                if (existing is not None) and (get_class_name(existing) != cls_name):
                     raise Exception("Duplicate plugin name encountered: name=%s, existing type=%s, new type=%s)"
-                                    % (name, str(type(self._all_plugins[name])), str(type(o))))
-        else:
+                                    % (name, str(type(existing)), str(type(o))))
+            # same plugin again (e.g., another group): only the group dict needs it
             for name in names:
-                self._all_plugins[name] = o
                 d[name] = o
+            return True
+        for name in names:
+            name = sys.intern(name)
+            all_plugins[name] = o
+            d[name] = o
         return True
 
+    def _instantiate(self, cls) -> Plugin:
+        """
+        Returns the plugin instance for the class, instantiating it only the
+        first time it is encountered (e.g., across entry point groups).
+
+        :param cls: the plugin class to get the instance for
+        :return: the plugin instance
+        :rtype: Plugin
+        """
+        p = self._class_instances.get(cls)
+        if p is None:
+            p = cls()
+            self._class_instances[cls] = p
+        return p
+
     def _init_plugin_class(self, c):
         """
         Initializes the class to restrict the plugins to.
@@ -346,7 +446,7 @@ class Registry:
             raise Exception("Class '%s' is not derived from '%s'!" % (str(c), str(Plugin)))
         return c
 
-    def _register_from_module(self, m: str, c: Optional = None):
+    def _register_from_module(self, m: str, c: Optional = None, out: Optional[Dict[str, Plugin]] = None):
         """
         Locates all the classes implementing the specified class in the module and
         adds them to the dictionary.
@@ -354,27 +454,44 @@ class Registry:
         :param m: the module to look for classes
         :type m: str
         :param c: the class that the plugins must be, any class derived from Plugin if None
+        :param out: the dictionary to register the plugins in, creates a new one if None
+        :type out: dict
         """
         c = self._init_plugin_class(c)
-        result = dict()
-
-        module = importlib.import_module(m)
-        for att_name in dir(module):
-            if att_name.startswith("_"):
-                continue
-            att = getattr(module, att_name)
-            if inspect.isclass(att) and issubclass(att, c):
-                try:
-                    p = att()
-                    if self._register_plugin(result, p):
-                        names = get_all_names(p)
-                        for name in names:
-                            result[name] = p
-                except NotImplementedError:
-                    pass
-                except:
-                    print("Problem encountered instantiating: " + m + "." + att_name, file=sys.stderr)
-                    traceback.print_exc()
+        result = dict() if out is None else out
+
+        # scanning a module for plugin classes is deterministic, so the outcome
+        # gets shared across all registry instances in the process
+        key = (m, get_class_name(c))
+        classes = _module_class_cache.get(key)
+        if classes is None:
+            classes = []
+            module = importlib.import_module(m)
+            exported = getattr(module, "__all__", None)
+            if exported is not None:
+                items = ((att_name, getattr(module, att_name)) for att_name in exported)
+            else:
+                # direct __dict__ view, avoids the sort and descriptor layer of dir()
+                items = vars(module).items()
+            for att_name, att in items:
+                if att_name.startswith("_"):
+                    continue
+                if isinstance(att, type) and (att is not c) and issubclass(att, c):
+                    classes.append(att)
+            classes = _module_class_cache[key] = tuple(classes)
+
+        for cls in classes:
+            try:
+                p = self._instantiate(cls)
+                self._register_plugin(result, p)
+            except NotImplementedError:
+                pass
+            except Exception:
+                # formatting the traceback is expensive, only do so when debugging
+                if _logger.isEnabledFor(logging.DEBUG):
+                    _logger.exception("Problem encountered instantiating: %s", get_class_name(cls))
+                else:
+                    _logger.warning("Problem encountered instantiating: %s", get_class_name(cls))
 
         return result
 
@@ -388,7 +505,7 @@ class Registry:
         result = dict()
 
         for m in self.actual_fallback_modules():
-            result.update(self._register_from_module(m, c))
+            self._register_from_module(m, c, out=result)
 
         return result
 
@@ -404,22 +521,31 @@ class Registry:
         c = self._init_plugin_class(c)
         result = dict()
 
-        for item in working_set.iter_entry_points(group, None):
-            # format: "plugin_name=plugin_module:plugin_class",
-            if self.mode == MODE_EXPLICIT:
-                cls = get_class(module_name=item.module_name, class_name=item.attrs[0])
-                if issubclass(cls, c):
-                    p = cls()
-                    if self._register_plugin(result, p):
-                        names = get_all_names(p)
-                        for name in names:
-                            result[name] = p
-            # format: "unique_string=plugin_module:superclass_name",
-            elif self.mode == MODE_DYNAMIC:
-                c = get_class(full_class_name=".".join(item.attrs))
-                result.update(self._register_from_module(item.module_name, c))
-            else:
-                raise Exception("Unhandled mode: %s" % self.mode)
+        # the mode cannot change mid-iteration, so dispatch on it once
+        mode = self.mode
+        if mode not in _MODES_SET:
+            raise Exception("Unhandled mode: %s" % mode)
+
+        # format: "plugin_name=plugin_module:plugin_class",
+        if mode == MODE_EXPLICIT:
+            # group by module, so each module only gets imported/looked up once
+            by_module = dict()
+            for item in _iter_entry_points(group):
+                module_name, _, attr = item.value.partition(":")
+                by_module.setdefault(module_name, []).append(attr)
+            for module_name, attrs in by_module.items():
+                module = importlib.import_module(module_name)
+                for attr in attrs:
+                    cls = getattr(module, attr)
+                    if issubclass(cls, c):
+                        p = self._instantiate(cls)
+                        self._register_plugin(result, p)
+        # format: "unique_string=plugin_module:superclass_name",
+        else:
+            for item in _iter_entry_points(group):
+                module_name, _, attr = item.value.partition(":")
+                c = get_class(full_class_name=attr)
+                self._register_from_module(module_name, c, out=result)
 
         return result
 
@@ -433,6 +559,29 @@ class Registry:
         """
         c = self._init_plugin_class(c)
 
+        # resolved by a registry with the same effective configuration before?
+        # the custom/env/entry-point flags decide whether the module fallback
+        # applies, so they have to be part of the key as well
+        key = (self.mode, group, get_class_name(c),
+               tuple(self.actual_fallback_modules()), tuple(self.actual_excluded_modules()),
+               (self._custom_modules is not None) and (len(self._custom_modules) > 0),
+               self.has_env_modules(),
+               any(True for _ in _iter_entry_points(group)),
+               self.enforce_uniqueness)
+        cached = Registry._shared_plugins.get(key)
+        if cached is not None:
+            # route through _register_plugin, so the uniqueness check across
+            # groups behaves the same whether the cache is warm or cold
+            plugins = dict()
+            seen = set()
+            for cls in cached.values():
+                if cls in seen:
+                    continue
+                seen.add(cls)
+                self._register_plugin(plugins, self._instantiate(cls))
+            self._plugins[group] = plugins
+            return
+
         # from entry points
         plugins = self._register_from_entry_point(group, c=c)
 
@@ -441,6 +590,7 @@ class Registry:
             plugins.update(self._register_from_modules(c=c))
 
         self._plugins[group] = plugins
+        Registry._shared_plugins[key] = {name: type(p) for name, p in plugins.items()}
 
     def plugins(self, group: str, c: Optional = None) -> Dict[str, Plugin]:
         """
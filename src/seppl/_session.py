@@ -1,27 +1,33 @@
 import argparse
 import logging
 
-from dataclasses import dataclass
+from typing import Any
 
-from wai.logging import set_logging_level
 
-
-@dataclass
 class Session:
     """
     Session object shared among reader, filter(s), writer.
     """
-    options: argparse.Namespace = None
-    """ global options. """
-
-    logger: logging.Logger = None
-    """ the global logger. """
 
-    count: int = 0
-    """ the record counter. """
+    __slots__ = ("options", "logger", "count", "current_input")
 
-    current_input = None
-    """ the current input etc. """
+    def __init__(self, options: argparse.Namespace = None, logger: logging.Logger = None,
+                 count: int = 0, current_input: Any = None):
+        """
+        Initializes the session.
+
+        :param options: the global options
+        :type options: argparse.Namespace
+        :param logger: the global logger
+        :type logger: logging.Logger
+        :param count: the record counter
+        :type count: int
+        :param current_input: the current input etc.
+        """
+        self.options = options
+        self.logger = logger
+        self.count = count
+        self.current_input = current_input
 
     def _add_option(self, name: str, value):
         """
@@ -44,6 +50,9 @@ class Session:
         :return: itself
         :rtype: Session
         """
+        # deferred import: only needed when the level actually gets set
+        from wai.logging import set_logging_level
+
         self._add_option("logging_level", level)
         set_logging_level(self.logger, level)
         return self
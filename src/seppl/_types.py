@@ -1,8 +1,13 @@
+import functools
 import importlib
-import inspect
+import sys
+import weakref
 
 from typing import Optional, Tuple, List
 
+_class_name_cache = weakref.WeakKeyDictionary()
+""" caches the fully qualified name per class, without keeping the classes alive. """
+
 
 class AnyData:
     """
@@ -11,6 +16,25 @@ class AnyData:
     pass
 
 
+@functools.lru_cache(maxsize=None)
+def _resolve_class(module_name: str, class_name: str) -> type:
+    """
+    Resolves the class in the module, importing the module if necessary.
+    Successful resolutions are cached, as they never change at runtime.
+
+    :param module_name: the name of the module
+    :type module_name: str
+    :param class_name: the name of the class within the module
+    :type class_name: str
+    :return: the class object
+    """
+    # already-imported modules skip the import machinery (and its lock)
+    m = sys.modules.get(module_name)
+    if m is None:
+        m = importlib.import_module(module_name)
+    return getattr(m, class_name)
+
+
 def get_class(full_class_name: Optional[str] = None,
               module_name: Optional[str] = None, class_name: Optional[str] = None) -> type:
     """
@@ -25,22 +49,19 @@ def get_class(full_class_name: Optional[str] = None,
     :return: the class object
     """
     if full_class_name is not None:
-        parts = full_class_name.split('.')
-        module = ".".join(parts[:-1])
-        m = importlib.import_module(module)
-        c = getattr(m, parts[-1])
-        return c
+        module_name, _, class_name = full_class_name.rpartition(".")
+        return _resolve_class(module_name, class_name)
     elif (module_name is not None) and (class_name is not None):
-        m = importlib.import_module(module_name)
-        c = getattr(m, class_name)
-        return c
+        return _resolve_class(module_name, class_name)
     else:
         raise Exception("Either fully qualified class name or module and class name must be supplied!")
 
 
+@functools.lru_cache(maxsize=None)
 def fix_module_name(module: str, cls: str) -> Tuple[str, str]:
     """
     Turns a.b._C.C into a.b.C if possible.
+    Cached, so the import probe (including its failure) runs only once per pair.
 
     :param module: the module
     :type module: str
@@ -49,10 +70,13 @@ def fix_module_name(module: str, cls: str) -> Tuple[str, str]:
     :return: the (potentially) updated tuple of module and class name
     :rtype: tuple
     """
-    if module.split(".")[-1].startswith("_"):
+    module_short, _, last = module.rpartition(".")
+    if last.startswith("_"):
         try:
-            module_short = ".".join(module.split(".")[:-1])
-            getattr(importlib.import_module(module_short), cls)
+            m = sys.modules.get(module_short)
+            if m is None:
+                m = importlib.import_module(module_short)
+            getattr(m, cls)
             module = module_short
         except Exception:
             pass
@@ -68,9 +92,13 @@ def get_class_name(obj: object) -> str:
     :return: the generated classname
     :rtype: str
     """
-    if inspect.isclass(obj):
-        m, c = fix_module_name(obj.__module__, obj.__name__)
-        return m + "." + c
+    if isinstance(obj, type):
+        result = _class_name_cache.get(obj)
+        if result is None:
+            m, c = fix_module_name(obj.__module__, obj.__name__)
+            result = m + "." + c
+            _class_name_cache[obj] = result
+        return result
     else:
         return get_class_name(obj.__class__)
 
@@ -1,6 +1,45 @@
-from ._reader import Reader
-from ._writer import Writer, StreamWriter, BatchWriter
-from ._filter import Filter, MultiFilter, FILTER_ACTIONS, FILTER_ACTION_KEEP, FILTER_ACTION_DISCARD
-from ._execution import execute
-from ._split import gcd, Splitter
-from ._utils import locate_files
+_EXPORTS = {
+    "Reader": "._reader",
+    "Writer": "._writer",
+    "StreamWriter": "._writer",
+    "BatchWriter": "._writer",
+    "Filter": "._filter",
+    "MultiFilter": "._filter",
+    "FILTER_ACTIONS": "._filter",
+    "FILTER_ACTION_KEEP": "._filter",
+    "FILTER_ACTION_DISCARD": "._filter",
+    "execute": "._execution",
+    "gcd": "._split",
+    "Splitter": "._split",
+    "locate_files": "._utils",
+}
+""" maps the public attributes to the sub-modules defining them. """
+
+__all__ = sorted(_EXPORTS.keys())
+
+
+def __getattr__(name):
+    """
+    Resolves the public attributes lazily (PEP 562), so that importing seppl.io
+    does not import all sub-modules up front.
+
+    :param name: the name of the attribute to resolve
+    :type name: str
+    :return: the resolved attribute
+    """
+    if name in _EXPORTS:
+        from importlib import import_module
+        value = getattr(import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    """
+    Returns the available attributes.
+
+    :return: the list of attributes
+    :rtype: list
+    """
+    return sorted(set(globals().keys()) | set(__all__))
@@ -7,6 +7,29 @@ from ._filter import Filter, MultiFilter
 from ._writer import Writer, StreamWriter, BatchWriter
 
 
+def _fuse_filters(filters: List[Filter]):
+    """
+    Fuses the filters into a single callable that passes a record through
+    all of them, stopping as soon as one drops it.
+
+    :param filters: the filters to fuse
+    :type filters: list
+    :return: the fused callable
+    """
+    processes = [f.process for f in filters]
+    if len(processes) == 1:
+        return processes[0]
+
+    def fused(item):
+        for process in processes:
+            item = process(item)
+            if item is None:
+                return None
+        return item
+
+    return fused
+
+
 def _stream_execution(reader: Reader, filter_: Optional[Filter], writer: Optional[Writer], session: Session):
     """
     Executes the pipeline in streaming mode.
@@ -24,18 +47,33 @@ def _stream_execution(reader: Reader, filter_: Optional[Filter], writer: Optiona
         if not isinstance(writer, StreamWriter):
             raise Exception("Not a stream writer: %s" % str(type(writer)))
 
-    while not reader.has_finished():
-        for item in reader.read():
-            if item is None:
-                continue
-            session.count += 1
-            if (filter_ is not None) and (item is not None):
-                item = filter_.process(item)
-            if item is not None:
-                if writer is not None:
-                    writer.write_stream(item)
-            if session.count % session.options.update_interval == 0:
-                session.logger.info("%d records processed..." % session.count)
+    # loop invariants, incl. pre-resolved bound methods
+    update_interval = session.options.update_interval
+    info = session.logger.info
+    if filter_ is None:
+        process = None
+    elif type(filter_) is MultiFilter:
+        # avoids MultiFilter's per-record list wrapping in the stream loop
+        process = _fuse_filters(filter_.filters)
+    else:
+        process = filter_.process
+    write = None if writer is None else writer.write_stream
+
+    # counts down to the next progress update, cheaper than a modulo per record
+    countdown = update_interval - session.count % update_interval
+
+    for item in reader:
+        if item is None:
+            continue
+        session.count += 1
+        if process is not None:
+            item = process(item)
+        if (item is not None) and (write is not None):
+            write(item)
+        countdown -= 1
+        if countdown == 0:
+            countdown = update_interval
+            info("%d records processed..." % session.count)
 
 
 def _batch_execution(reader: Reader, filter_: Optional[Filter], writer: Optional[Writer], session: Session):
@@ -51,30 +89,48 @@ def _batch_execution(reader: Reader, filter_: Optional[Filter], writer: Optional
     :param session: the session object to use
     :type session: Session
     """
+    # loop invariants
+    update_interval = session.options.update_interval
+    info = session.logger.info
+
+    # counts down to the next progress update, cheaper than a modulo per record
+    countdown = update_interval - session.count % update_interval
+
+    # nothing observes session.count while reading, so tally in a local and
+    # only sync the session at the log boundaries and once at the end
+    count = session.count
     data = []
-    while not reader.has_finished():
-        for item in reader.read():
-            if item is None:
-                continue
-            session.count += 1
-            data.append(item)
-            if session.count % session.options.update_interval == 0:
-                session.logger.info("%d records read..." % session.count)
+    for item in reader:
+        if item is None:
+            continue
+        count += 1
+        data.append(item)
+        countdown -= 1
+        if countdown == 0:
+            countdown = update_interval
+            session.count = count
+            info("%d records read..." % count)
+    session.count = count
 
     if filter_ is not None:
         data = filter_.process(data)
         session.logger.info("%d records filtered..." % session.count)
-        if not isinstance(data, list):
+        # exact type check, the filter output is always a plain list or a single record
+        if type(data) is not list:
             data = [data]
 
     if writer is not None:
         if isinstance(writer, StreamWriter):
             count = 0
+            countdown = update_interval
+            write_stream = writer.write_stream
             for item in data:
                 count += 1
-                writer.write_stream(item)
-                if count % session.options.update_interval == 0:
-                    session.logger.info("%d records written..." % count)
+                write_stream(item)
+                countdown -= 1
+                if countdown == 0:
+                    countdown = update_interval
+                    info("%d records written..." % count)
         elif isinstance(writer, BatchWriter):
             writer.write_batch(data)
         else:
@@ -105,37 +161,41 @@ def execute(reader: Reader, filters: Optional[Union[Filter, List[Filter]]], writ
     else:
         raise Exception("Unhandled filter(s) type: %s" % str(type(filters)))
 
-    # propagate session
-    if session is None:
-        session = Session()
-    reader.session = session
+    # collect the components once, so each None check only happens here
+    components = [(reader, "reader")]
     if filter_ is not None:
-        filter_.session = session
+        components.append((filter_, "filter"))
     if writer is not None:
-        writer.session = session
+        components.append((writer, "writer"))
+
+    # propagate session and determine the components that require lifecycle management
+    if session is None:
+        session = Session()
+    lifecycle = []
+    for obj, handler_type in components:
+        obj.session = session
+        if isinstance(obj, Initializable):
+            lifecycle.append((obj, handler_type))
 
     # initialize
-    if isinstance(reader, Initializable) and not init_initializable(reader, "reader"):
-        return
-    if (filter_ is not None) and isinstance(filter_, Initializable) and not init_initializable(filter_, "filter"):
-        return
-    if (writer is not None) and isinstance(writer, Initializable) and not init_initializable(writer, "writer"):
-        return
+    for obj, handler_type in lifecycle:
+        if not init_initializable(obj, handler_type):
+            return
 
     # process data
     try:
-        if session.options.force_batch or isinstance(writer, BatchWriter):
-            _batch_execution(reader, filter_, writer, session)
-        else:
-            _stream_execution(reader, filter_, writer, session)
-        session.logger.info("%d records processed in total." % session.count)
-    except:
-        traceback.print_exc()
-
-    # clean up
-    if isinstance(reader, Initializable):
-        reader.finalize()
-    if (filter_ is not None) and isinstance(filter_, Initializable):
-        filter_.finalize()
-    if (writer is not None) and isinstance(writer, Initializable):
-        writer.finalize()
+        try:
+            if session.options.force_batch or isinstance(writer, BatchWriter):
+                _batch_execution(reader, filter_, writer, session)
+            else:
+                _stream_execution(reader, filter_, writer, session)
+            session.logger.info("%d records processed in total." % session.count)
+        except Exception:
+            if session.logger is not None:
+                session.logger.exception("Failed to execute pipeline!")
+            else:
+                traceback.print_exc()
+    finally:
+        # clean up, also on KeyboardInterrupt/SystemExit
+        for obj, _ in lifecycle:
+            obj.finalize()
@@ -1,4 +1,5 @@
 import abc
+import sys
 from typing import List
 
 from wai.logging import LOGGING_WARNING
@@ -59,7 +60,8 @@ class Filter(PluginWithLogging, InputConsumer, OutputProducer, SessionHandler, I
         :rtype: bool
         """
         if current_input is None:
-            current_input = self.session.current_input
+            # direct attribute access, skips the session property descriptor
+            current_input = self._session.current_input
         result = self._last_input != current_input
         if update:
             self._update_last_input(current_input)
@@ -72,6 +74,10 @@ class Filter(PluginWithLogging, InputConsumer, OutputProducer, SessionHandler, I
         :param current_input: the "new" last input
         :type current_input: str
         """
+        # interning lets the per-record comparison in _has_input_changed hit
+        # the pointer-equality fast path for repeated paths
+        if type(current_input) is str:
+            current_input = sys.intern(current_input)
         self._last_input = current_input
 
     def _requires_list_input(self) -> bool:
@@ -104,13 +110,17 @@ class Filter(PluginWithLogging, InputConsumer, OutputProducer, SessionHandler, I
                 result = self._do_process(data)
             else:
                 result = []
+                # hot flatten loop: pre-bound methods and an exact type check
+                do_process = self._do_process
+                append = result.append
+                extend = result.extend
                 for d in data:
-                    r = self._do_process(d)
+                    r = do_process(d)
                     if r is not None:
-                        if isinstance(r, list):
-                            result.extend(r)
+                        if type(r) is list:
+                            extend(r)
                         else:
-                            result.append(r)
+                            append(r)
                 if len(result) == 1:
                     result = result[0]
         else:
@@ -126,6 +136,9 @@ class MultiFilter(Filter, Initializable):
     Combines multiple filters.
     """
 
+    _DEEP_ATTRS = ("filters",)
+    """ the base filters must not be shared between copies. """
+
     def __init__(self, filters: List[Filter] = None, logger_name: str = None, logging_level: str = LOGGING_WARNING):
         """
         Initialize with the specified filters.
@@ -44,6 +44,15 @@ class Reader(PluginWithLogging, OutputProducer, SessionHandler, abc.ABC):
         """
         self._session = s
 
+    def __iter__(self):
+        """
+        Iterates over all the data, calling read until has_finished reports True.
+
+        :return: the data, one item at a time
+        """
+        while not self.has_finished():
+            yield from self.read()
+
     def read(self) -> Iterable:
         """
         Loads the data and returns the items one by one.
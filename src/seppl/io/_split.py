@@ -1,3 +1,5 @@
+import bisect
+import functools
 import math
 
 from typing import Dict, List
@@ -14,12 +16,7 @@ def gcd(values: List[int]):
     """
     if len(values) < 2:
         raise Exception("At least two numbers required for gcd!")
-    values = values[:]
-    result = values.pop(0)
-    while len(values) > 0:
-        b = values.pop(0)
-        result = math.gcd(result, b)
-    return result
+    return functools.reduce(math.gcd, values)
 
 
 class Splitter:
@@ -27,6 +24,8 @@ class Splitter:
     Class for dividing a token stream into sub-streams.
     """
 
+    __slots__ = ("split_ratios", "split_names", "_schedule", "_counter", "_stats")
+
     def __init__(self, split_ratios: List[int], split_names: List[str]):
         """
         Initializes the splitter.
@@ -59,7 +58,9 @@ class Splitter:
         _gcd = gcd(self.split_ratios)
         self._schedule = [0] * (len(self.split_ratios) + 1)
         for i, ratio in enumerate(self.split_ratios):
-            self._schedule[i + 1] = self._schedule[i] + ratio / _gcd
+            # the gcd divides each ratio exactly, so integer division keeps the
+            # schedule int-only and the counter comparisons exact
+            self._schedule[i + 1] = self._schedule[i] + ratio // _gcd
         self._counter = 0
         self._stats = dict()
 
@@ -77,10 +78,9 @@ class Splitter:
         :return: the name of the split
         :rtype: str
         """
-        split = None
-        for i in range(len(self.split_names)):
-            if (self._counter >= self._schedule[i]) and (self._counter < self._schedule[i + 1]):
-                split = self.split_names[i]
+        # the schedule is sorted, so locate the bucket with a binary search
+        # instead of scanning all splits per record
+        split = self.split_names[bisect.bisect_right(self._schedule, self._counter) - 1]
 
         # update counter
         self._counter += 1
@@ -88,9 +88,7 @@ class Splitter:
             self._counter = 0
 
         # update stats
-        if split not in self._stats:
-            self._stats[split] = 0
-        self._stats[split] += 1
+        self._stats[split] = self._stats.get(split, 0) + 1
 
         return split
 
@@ -1,7 +1,53 @@
+import fnmatch
 import glob
 import os
 
-from typing import Union, List
+from typing import Iterator, Union, List
+
+
+def _glob_files(pattern: str, recursive: bool = False) -> Iterator[str]:
+    """
+    Yields the files (not directories) matching the glob pattern.
+    For patterns whose directory part is literal, a single scandir call
+    supplies the names and the cached entry types, avoiding the extra
+    stat call per match that glob.glob + os.path.isdir would incur.
+
+    :param pattern: the glob pattern to expand
+    :type pattern: str
+    :param recursive: for supporting recursive globs
+    :type recursive: bool
+    :return: the matching files
+    :rtype: Iterator
+    """
+    dirname, basename = os.path.split(pattern)
+    if glob.has_magic(dirname) or (recursive and ("**" in basename)):
+        # complex pattern, let glob do the walking
+        for f in glob.iglob(pattern, recursive=recursive):
+            if not os.path.isdir(f):
+                yield f
+    elif glob.has_magic(basename):
+        # single-directory pattern: one scandir, entry types come for free
+        hidden_ok = basename.startswith(".")
+        try:
+            with os.scandir(dirname if (len(dirname) > 0) else ".") as it:
+                for entry in it:
+                    name = entry.name
+                    if name.startswith(".") and not hidden_ok:
+                        continue
+                    if not fnmatch.fnmatch(name, basename):
+                        continue
+                    try:
+                        if entry.is_dir():
+                            continue
+                    except OSError:
+                        pass
+                    yield os.path.join(dirname, name)
+        except OSError:
+            pass
+    else:
+        # literal path
+        if os.path.exists(pattern) and not os.path.isdir(pattern):
+            yield pattern
 
 
 def locate_files(inputs: Union[str, List[str]], input_lists: Union[str, List[str]] = None,
@@ -38,7 +84,9 @@ def locate_files(inputs: Union[str, List[str]], input_lists: Union[str, List[str
 
         if default_glob is not None:
             for i, inp in enumerate(inputs):
-                if os.path.isdir(inp):
+                # a path with glob magic cannot be a directory, so the string
+                # check avoids the stat syscall for glob inputs
+                if (not glob.has_magic(inp)) and os.path.isdir(inp):
                     inputs[i] = os.path.join(inp, default_glob)
 
     if input_lists is not None:
@@ -54,13 +102,13 @@ def locate_files(inputs: Union[str, List[str]], input_lists: Union[str, List[str
     # globs
     if inputs is not None:
         for inp in inputs:
-            for f in sorted(glob.glob(inp, recursive=recursive)):
-                if os.path.isdir(f):
-                    continue
-                result.append(f)
+            result.extend(sorted(_glob_files(inp, recursive=recursive)))
 
     # path lists
     if input_lists is not None:
+        # existence checks batched per parent directory: one listing instead
+        # of one stat syscall per line; None marks an unlistable parent
+        dir_names = dict()
         for inp in input_lists:
             if not os.path.exists(inp):
                 print("WARNING: Input list does not exist: %s" % inp)
@@ -68,13 +116,27 @@ def locate_files(inputs: Union[str, List[str]], input_lists: Union[str, List[str
             if os.path.isdir(inp):
                 print("WARNING: Input list points to directory: %s" % inp)
                 continue
+            # stream the file rather than materializing all lines up front
             with open(inp, "r") as fp:
-                lines = [x.strip() for x in fp.readlines()]
-            for line in lines:
-                if not os.path.exists(line):
-                    print("WARNING: Path from input list '%s' does not exist: %s" % (inp, line))
-                    continue
-                result.append(line)
+                for line in fp:
+                    line = line.strip()
+                    d, n = os.path.split(line)
+                    if len(n) == 0:
+                        # no file name part, e.g., trailing slash
+                        exists = os.path.exists(line)
+                    else:
+                        names = dir_names.get(d, False)
+                        if names is False:
+                            try:
+                                names = set(os.listdir(d if (len(d) > 0) else "."))
+                            except OSError:
+                                names = None
+                            dir_names[d] = names
+                        exists = (names is not None) and (n in names)
+                    if not exists:
+                        print("WARNING: Path from input list '%s' does not exist: %s" % (inp, line))
+                        continue
+                    result.append(line)
 
     if fail_if_empty and (len(result) == 0):
         raise Exception("Failed to locate any files using: %s" % str(inputs))
@@ -1,4 +1,5 @@
 import abc
+import sys
 from typing import Iterable
 
 from wai.logging import LOGGING_WARNING
@@ -57,7 +58,8 @@ class Writer(PluginWithLogging, InputConsumer, SessionHandler, abc.ABC):
         :rtype: bool
         """
         if current_input is None:
-            current_input = self.session.current_input
+            # direct attribute access, skips the session property descriptor
+            current_input = self._session.current_input
         result = self._last_input != current_input
         if update:
             self._update_last_input(current_input)
@@ -70,6 +72,10 @@ class Writer(PluginWithLogging, InputConsumer, SessionHandler, abc.ABC):
         :param current_input: the "new" last input
         :type current_input: str
         """
+        # interning lets the per-record comparison in _has_input_changed hit
+        # the pointer-equality fast path for repeated paths
+        if type(current_input) is str:
+            current_input = sys.intern(current_input)
         self._last_input = current_input
 
     def _output_needs_changing(self, current_output: str, target: str, ext: str) -> bool: